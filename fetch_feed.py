@@ -6,26 +6,83 @@ Usage::
     python fetch_feed.py
 """
 
-import xml.etree.ElementTree as ET
+import atexit
+import html
+import json
+import os
 import requests
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 
+try:
+    from lxml import etree as ET
+except ImportError:  # lxml is optional; the stdlib parser works the same here
+    import xml.etree.ElementTree as ET
+    _ITERPARSE_OPTIONS: dict = {}
+else:
+    # Recover from malformed feeds and never expand entities; only <item>
+    # elements are handed back to Python, the rest is filtered in C.
+    _ITERPARSE_OPTIONS = {"huge_tree": False, "recover": True, "resolve_entities": False,
+                          "tag": "item"}
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; fall back to CATEGORY_RE
+    ahocorasick = None
+
+
+# Whole-word, case-insensitive keywords.
 AI_KEYWORDS = [
-    r"\bai\b", r"\bartificial intelligence\b", r"\bmachine learning\b",
-    r"\bgen ai\b", r"\bchatgpt\b", r"\bopenai\b", r"\bdeep learning\b",
-    r"\bneural network\b", r"\bgenerative ai\b", r"\bagent ai\b",
-    r"\bagentic ai\b", r"\bgpt\b"
+    "ai", "artificial intelligence", "machine learning",
+    "gen ai", "chatgpt", "openai", "deep learning",
+    "neural network", "generative ai", "agent ai",
+    "agentic ai", "gpt"
 ]
 
 RESEARCH_KEYWORDS = [
-    r"\bstudy\b", r"\bresearch\b", r"\bsurvey\b", r"\breport\b",
-    r"\bwhitepaper\b", r"\banalysis\b", r"\binsight\b",
-    r"\bacademic\b", r"\binstitute\b", r"\bdata-driven\b"
+    "study", "research", "survey", "report",
+    "whitepaper", "analysis", "insight",
+    "academic", "institute", "data-driven"
 ]
 
+CATEGORIES = ("AI", "Research", "General")
+
+# Category membership as a bitmask; each mask maps to its names in CATEGORIES order.
+_CATEGORY_BITS = {cat: 1 << i for i, cat in enumerate(CATEGORIES)}
+_CATEGORIES_BY_MASK = tuple(
+    tuple(cat for cat, bit in _CATEGORY_BITS.items() if mask & bit)
+    for mask in range(1 << len(CATEGORIES))
+)
+
+_KEYWORD_CATEGORIES = {"AI": AI_KEYWORDS, "Research": RESEARCH_KEYWORDS}
+
+if ahocorasick is not None:
+    # One automaton for every keyword: a single linear scan in C per text.
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _cat, _words in _KEYWORD_CATEGORIES.items():
+        for _word in _words:
+            _KEYWORD_AUTOMATON.add_word(_word, (_cat, len(_word)))
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    _KEYWORD_AUTOMATON = None
+
+# Regex fallback: one named group per category, so ``match.lastgroup`` names it.
+CATEGORY_RE = re.compile(
+    "|".join(
+        rf"(?P<{cat}>\b(?:{'|'.join(map(re.escape, words))})\b)"
+        for cat, words in _KEYWORD_CATEGORIES.items()
+    ),
+    re.IGNORECASE,
+)
 
 FEEDS = {
     "Marketing Dive": "https://www.marketingdive.com/feeds/news/",
@@ -38,61 +95,241 @@ FEEDS = {
     "American Marketing Association": "https://www.ama.org/feed/",
 }
 
+# Categories every entry from a given source belongs to, regardless of keywords.
+SOURCE_CATEGORIES = {
+    "American Marketing Association": ("Research",),
+}
+
+# One pooled session for every fetch: connections (and TLS handshakes) are
+# reused across feeds, and it is safe to share between the fetch threads.
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = "briefed/1.0"
+_ADAPTER = HTTPAdapter(
+    pool_connections=16, pool_maxsize=16,
+    # Retry-After is ignored so a 429/503 can't stall a worker past the backoff.
+    max_retries=Retry(total=2, backoff_factor=0.5,
+                      status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=frozenset(["GET"]),
+                      respect_retry_after_header=False),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+atexit.register(_SESSION.close)
+
+# (connect, read) seconds: a stalled server fails fast instead of hanging the run.
+REQUEST_TIMEOUT = (3, 10)
+
+# Feeds bigger than this are abandoned rather than parsed.
+MAX_FEED_BYTES = 5 * 1024 * 1024
+
+# ETag/Last-Modified and parsed items per URL, relative to this script.
+CACHE_PATH = Path(".cache") / "feeds.json"
+
+_MIN_DATE = datetime.min.replace(tzinfo=timezone.utc)
+
+# English month abbreviations, as ``%b`` renders them in the C locale.
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+@dataclass(slots=True)
+class Entry:
+    """One article: the fetched fields, then what ``process_entries`` derives."""
+
+    source: str
+    title: str
+    link: str
+    published: str
+    description: str = ""
+    summary: str = ""
+    date: str = ""
+    sort_key: datetime = _MIN_DATE
+
+
+# Entry fields kept in the feed cache (the rest is derived on every run).
+_CACHED_FIELDS = ("title", "link", "published", "description")
+
+
+def parse_published(value: str) -> datetime | None:
+    """Parse an RFC 822 ``pubDate`` into an aware datetime, or ``None``."""
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if dt.tzinfo is None:  # "-0000" means UTC with unknown local offset
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def strip_tags(text: str) -> str:
+    """Remove HTML tags from ``text`` and decode its entities."""
+    if "<" not in text and "&" not in text:  # plain text, nothing to do
+        return text
+
+    # Single pass over the string: a tag is "<", at least one character that
+    # is not "<", then ">" -- the same rule as the old ``<[^<]+?>`` regex.
+    pieces: list[str] = []
+    pos = 0
+    end = -1
+    start = text.find("<")
+    while start != -1:
+        if end < start + 2:
+            end = text.find(">", start + 2)
+            if end == -1:
+                break
+        nxt = text.find("<", start + 1, end)
+        if nxt != -1:
+            start = nxt
+            continue
+        pieces.append(text[pos:start])
+        pos = end + 1
+        start = text.find("<", end + 1)
+    pieces.append(text[pos:])
+    return html.unescape("".join(pieces))
+
 
 def summarize_text(text: str, max_sentences: int = 2) -> str:
     """Return a naive summary by taking the first ``max_sentences`` sentences."""
-    text = re.sub(r"<[^<]+?>", "", text)  # strip HTML tags
-    text = re.sub(r"\s+", " ", text).strip()
-    sentences = re.split(r"(?<=[.!?])\s+", text)
-    return " ".join(sentences[:max_sentences])
+    if not text or text.isspace():
+        return ""
+    # collapse whitespace runs and trim both ends in one C-level pass
+    text = " ".join(strip_tags(text).split())
+    # Only look as far as the last sentence break needed.
+    pos = 0
+    for _ in range(max_sentences):
+        match = _SENT_RE.search(text, pos)
+        if match is None:
+            return text
+        pos = match.end()
+    return text[:match.start()] if max_sentences > 0 else ""
+
+
+class _CappedReader:
+    """File-like wrapper that refuses to read more than ``limit`` bytes."""
+
+    def __init__(self, raw, limit: int) -> None:
+        self._raw = raw
+        self._limit = limit
+        self._remaining = limit
+
+    def read(self, size: int = -1) -> bytes:
+        # Ask for at most one byte past the limit, just enough to detect overflow.
+        if size is None or size < 0 or size > self._remaining + 1:
+            size = self._remaining + 1
+        data = self._raw.read(size)
+        self._remaining -= len(data)
+        if self._remaining < 0:
+            raise ValueError(f"feed is larger than {self._limit} bytes")
+        return data
+
+
+def parse_rss_items(stream, source: str, count: int = 5) -> list[Entry]:
+    """Stream-parse RSS from a file-like ``stream``, stopping after ``count`` items."""
+    items: list[Entry] = []
+    if count <= 0:
+        return items
+    for _, elem in ET.iterparse(stream, events=("end",), **_ITERPARSE_OPTIONS):
+        if elem.tag != "item":
+            continue
+        items.append(Entry(
+            source=source,
+            title=elem.findtext("title", default=""),
+            link=elem.findtext("link", default=""),
+            published=elem.findtext("pubDate", default=""),
+            description=elem.findtext("description", default=""),
+        ))
+        elem.clear()
+        if len(items) >= count:
+            break
+    return items
+
+
+@lru_cache(maxsize=256)
+def _summarize_cached(text: str) -> str:
+    """``summarize_text`` memoized, for descriptions repeated within a run."""
+    return summarize_text(text)
+
+
+def load_cache(path: Path) -> dict:
+    """Load the feed cache written by ``save_cache`` (empty if missing or unreadable)."""
+    try:
+        cache = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_cache(cache: dict, path: Path) -> None:
+    """Persist the feed cache as JSON, creating its directory if needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(cache, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
-def fetch_feed_items(source: str, feed_url: str, count: int = 5) -> list[dict]:
-    """Fetch ``count`` items from a given RSS feed URL (or scrape AMA site)."""
-    items: list[dict] = []
+def fetch_feed_items(source: str, feed_url: str, count: int = 5,
+                     session: requests.Session = _SESSION,
+                     cache: dict | None = None) -> list[Entry]:
+    """Fetch ``count`` items from a given RSS feed URL (or scrape AMA site).
+
+    ``session`` defaults to the shared pooled session.  ``cache`` maps URLs to their last
+    ``ETag``/``Last-Modified`` and parsed items: the request is made conditional
+    and a ``304 Not Modified`` reuses the cached items without parsing.
+    """
+    items: list[Entry] = []
 
     try:
         # מקרה מיוחד: American Marketing Association → Scraping
-        if source == "American Marketing Association":
-            resp = requests.get("https://www.ama.org/marketing-news-home/", timeout=10)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            cards = soup.find_all(class_="card__body")[:count]
-            for card in cards:
-                title_tag = card.find("h2")
-                link_tag = title_tag.find("a") if title_tag else None
-                title = link_tag.get_text(strip=True) if link_tag else ""
-                link = link_tag["href"] if link_tag else ""
-
-                all_ps = card.find_all("p")
-                summary = ""
-                if len(all_ps) > 1:
-                    summary = all_ps[1].get_text(strip=True)
-
-                items.append({
-                    "title": title,
-                    "link": link,
-                    "published": "",  # אין תאריך באתר
-                    "description": summary,
-                })
-
-        else:
-            # שאר האתרים → RSS רגיל
-            response = requests.get(feed_url, timeout=10)
+        is_ama = source == "American Marketing Association"
+        url = "https://www.ama.org/marketing-news-home/" if is_ama else feed_url
+
+        cached = cache.get(url) if cache is not None else None
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        with session.get(url, timeout=REQUEST_TIMEOUT, headers=headers, stream=True) as response:
+            if response.status_code == 304 and cached:
+                return [Entry(source, **item) for item in cached["items"]]
             response.raise_for_status()
-            root = ET.fromstring(response.content)
-            for item in root.findall(".//item")[:count]:
-                title = item.findtext("title", default="")
-                link = item.findtext("link", default="")
-                pub_date = item.findtext("pubDate", default="")
-                description = item.findtext("description", default="")
-                items.append({
-                    "title": title,
-                    "link": link,
-                    "published": pub_date,
-                    "description": description,
-                })
+
+            if is_ama:
+                soup = BeautifulSoup(response.text, "html.parser")
+
+                cards = soup.find_all(class_="card__body")[:count]
+                for card in cards:
+                    title_tag = card.find("h2")
+                    link_tag = title_tag.find("a") if title_tag else None
+                    title = link_tag.get_text(strip=True) if link_tag else ""
+                    link = link_tag["href"] if link_tag else ""
+
+                    all_ps = card.find_all("p")
+                    summary = ""
+                    if len(all_ps) > 1:
+                        summary = all_ps[1].get_text(strip=True)
+
+                    items.append(Entry(
+                        source=source,
+                        title=title,
+                        link=link,
+                        published="",  # אין תאריך באתר
+                        description=summary,
+                    ))
+
+            else:
+                # שאר האתרים → RSS רגיל, parsed straight off the socket
+                response.raw.decode_content = True
+                items = parse_rss_items(_CappedReader(response.raw, MAX_FEED_BYTES), source, count)
+
+        if cache is not None:
+            cache[url] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "items": [{f: getattr(item, f) for f in _CACHED_FIELDS} for item in items],
+            }
 
     except Exception as exc:
         print(f"⚠️ Failed to fetch {source}: {exc}")
@@ -100,143 +337,182 @@ def fetch_feed_items(source: str, feed_url: str, count: int = 5) -> list[dict]:
 
 
 
-def categorize_entry(entry: dict) -> list[str]:
-    """Return a list of categories (AI, Research, General) for an entry."""
-    text = (entry["title"] + " " + entry["summary"]).lower()
-    categories = []
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
 
-    # חוקים לפי מקור
-    if entry["source"] == "American Marketing Association":
-        categories.append("Research")
 
-    # AI
-    if any(re.search(pattern, text) for pattern in AI_KEYWORDS):
-        categories.append("AI")
-    
-    # Research
-    if any(re.search(pattern, text) for pattern in RESEARCH_KEYWORDS):
-        categories.append("Research")
+def keyword_categories(text: str) -> set[str]:
+    """Return the keyword categories whose keywords appear in ``text`` as whole words.
+
+    The scan stops as soon as every category has matched.
+    """
+    matched: set[str] = set()
+    if _KEYWORD_AUTOMATON is None:
+        for match in CATEGORY_RE.finditer(text):
+            matched.add(match.lastgroup)
+            if len(matched) == len(_KEYWORD_CATEGORIES):
+                break
+        return matched
+
+    text = text.lower()
+    last = len(text) - 1
+    for end, (cat, length) in _KEYWORD_AUTOMATON.iter(text):
+        start = end - length + 1
+        # Same rule as ``\b``: keywords start and end on word characters.
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < last and _is_word_char(text[end + 1]):
+            continue
+        matched.add(cat)
+        if len(matched) == len(_KEYWORD_CATEGORIES):
+            break
+    return matched
+
+
+def categorize_entry(entry: Entry) -> list[str]:
+    """Return a list of categories (AI, Research, General) for an entry."""
+    text = entry.title + " " + entry.summary
+    mask = 0
 
+    # חוקים לפי מקור
+    for cat in SOURCE_CATEGORIES.get(entry.source, ()):
+        mask |= _CATEGORY_BITS[cat]
 
+    # AI / Research
+    for cat in keyword_categories(text):
+        mask |= _CATEGORY_BITS[cat]
 
     # General
-    if not categories:
-        categories.append("General")
-
-    return list(set(categories))  # הסרה של כפילויות
-
-
-def process_entries(feed_dict: dict) -> list[dict]:
-    """Fetch and summarize all entries from a feed dictionary."""
-    entries: list[dict] = []
-    for source, url in feed_dict.items():
-        items = fetch_feed_items(source, url, count=5)
-        for item in items:
-            summary = summarize_text(item["description"]) or "No summary available."
-            entries.append({
-                "source": source,
-                "title": item["title"],
-                "link": item["link"],
-                "published": item["published"],
-                "summary": summary,
-            })
-
-    # sort by date
-    def parse_date(entry):
-        from email.utils import parsedate
-        return parsedate(entry.get("published", "")) or (0,)
-    entries.sort(key=parse_date, reverse=True)
-
-    # format dates
-    for entry in entries:
-        try:
-            from email.utils import parsedate_to_datetime
-            dt = parsedate_to_datetime(entry.get("published", ""))
-            entry["date"] = dt.strftime("%d %b %Y") if dt else ""
-        except Exception:
-            entry["date"] = ""
+    return list(_CATEGORIES_BY_MASK[mask or _CATEGORY_BITS["General"]])
+
+
+def process_entries(feed_dict: dict, cache: dict | None = None) -> list[Entry]:
+    """Fetch and summarize all entries from a feed dictionary.
+
+    Feeds are fetched concurrently (the work is network-bound) over the shared
+    pooled session, then assembled in ``feed_dict`` order.  ``cache`` is passed
+    through to ``fetch_feed_items`` and updated in place.
+    """
+    results: dict[str, list[Entry]] = {}
+    with ThreadPoolExecutor(max_workers=max(len(feed_dict), 1)) as ex:
+        futures = {
+            ex.submit(fetch_feed_items, source, url, 5, cache=cache): source
+            for source, url in feed_dict.items()
+        }
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                results[source] = future.result()
+            except Exception as exc:  # one broken feed must not sink the others
+                print(f"⚠️ Failed to fetch {source}: {exc}")
+                results[source] = []
+
+    entries: list[Entry] = []
+    for source in feed_dict:
+        for entry in results[source]:
+            entry.summary = _summarize_cached(entry.description) or "No summary available."
+            # parse the date once, for both the sort key and the display string
+            dt = parse_published(entry.published)
+            if dt:
+                entry.date = f"{dt.day:02d} {_MONTHS[dt.month - 1]} {dt.year}"
+                entry.sort_key = dt  # undated entries keep _MIN_DATE and sort last
+            entries.append(entry)
+
+    entries.sort(key=attrgetter("sort_key"), reverse=True)
     return entries
 
 
-def generate_html(all_entries: list[dict], output_path: Path) -> None:
-    """Generate HTML file with tabs for categories."""
-    categories_map = {"AI": [], "Research": [], "General": []}
-    for entry in all_entries:
-        cats = categorize_entry(entry)
-        for c in cats:
-            categories_map[c].append(entry)
-
-    parts: list[str] = []
-    parts.append("<html><head><meta charset='UTF-8'><title>Briefed. Feed</title>")
-    parts.append("<link href='https://fonts.googleapis.com/css2?family=Poppins:wght@400;600&display=swap' rel='stylesheet'>")
-    parts.append(
-        "<style>\n"
-        "body {font-family:'Poppins',sans-serif; background:#f8f9fc; margin:0;}\n"
-        ".header {background:linear-gradient(90deg,#1f2eb8,#525cff); padding:20px 40px; color:#fff;}\n"
-        ".header h1 {margin:0; font-size:2.2em; font-weight:600;}\n"
-        ".tabs {display:flex; justify-content:center; gap:10px; margin:20px;}\n"
-        ".tabs button {padding:8px 16px; border:1px solid #ccc; border-radius:6px; cursor:pointer; background:#fff;}\n"
-        ".tabs button.active {background:#1f2eb8; color:#fff; border-color:#1f2eb8;}\n"
-        ".entries {max-width:1100px; margin:20px auto; padding:0 20px; display:grid; grid-template-columns:repeat(auto-fill,minmax(300px,1fr)); gap:20px;}\n"
-        ".card {background:#fff; border-radius:10px; padding:20px; box-shadow:0 4px 12px rgba(0,0,0,0.08);}\n"
-        ".card .source {color:#525cff; font-size:0.75em; text-transform:uppercase; margin-bottom:4px;}\n"
-        ".card .date {color:#757575; font-size:0.8em; margin-top:6px;}\n"
-        ".card a {color:#1f2eb8; text-decoration:none; font-size:1.1em; font-weight:600;}\n"
-        ".card a:hover {text-decoration:underline;}\n"
-        ".card .summary {margin-top:10px; font-size:0.9em; color:#444;}\n"
-        ".footer {background:#fff; text-align:center; padding:15px; font-size:0.8em; color:#1f2eb8; border-top:1px solid #eee;}\n"
-        ".hidden {display:none;}\n"
-        "</style></head><body>"
-    )
-
-    # Header
-    parts.append("<div class='header'><h1>Briefed.</h1><p>Your marketing news in one place</p></div>")
-
-    # Tabs
-    parts.append("<div class='tabs'>")
-    for cat in categories_map.keys():
-        parts.append(f"<button onclick=\"showTab('{cat}')\" id='btn-{cat}'>{cat}</button>")
-    parts.append("</div>")
-
-    # Content sections
-    for cat, entries in categories_map.items():
-        parts.append(f"<div id='tab-{cat}' class='entries hidden'>")
-        for entry in entries:
-            parts.append("<div class='card'>")
-            parts.append(f"<div class='source'>{entry['source']}</div>")
-            parts.append(f"<a href='{entry['link']}' target='_blank'>{entry['title']}</a>")
-            if entry.get("date"):
-                parts.append(f"<div class='date'>{entry['date']}</div>")
-            parts.append(f"<div class='summary'>{entry['summary']}</div>")
-            parts.append("</div>")
-        parts.append("</div>")
-
-    # Footer
-    parts.append("<div class='footer'>Updated automatically every day via GitHub Actions · <span style='color:#1f2eb8;font-weight:600;'>Created by Rotem Bachar</span></div>")
-
-    # JS for tabs
-    parts.append("""
-<script>
+_CSS = """
+body {font-family:'Poppins',sans-serif; background:#f8f9fc; margin:0;}
+.header {background:linear-gradient(90deg,#1f2eb8,#525cff); padding:20px 40px; color:#fff;}
+.header h1 {margin:0; font-size:2.2em; font-weight:600;}
+.tabs {display:flex; justify-content:center; gap:10px; margin:20px;}
+.tabs button {padding:8px 16px; border:1px solid #ccc; border-radius:6px; cursor:pointer; background:#fff;}
+.tabs button.active {background:#1f2eb8; color:#fff; border-color:#1f2eb8;}
+.entries {max-width:1100px; margin:20px auto; padding:0 20px; display:grid; grid-template-columns:repeat(auto-fill,minmax(300px,1fr)); gap:20px;}
+.card {background:#fff; border-radius:10px; padding:20px; box-shadow:0 4px 12px rgba(0,0,0,0.08);}
+.card .source {color:#525cff; font-size:0.75em; text-transform:uppercase; margin-bottom:4px;}
+.card .date {color:#757575; font-size:0.8em; margin-top:6px;}
+.card a {color:#1f2eb8; text-decoration:none; font-size:1.1em; font-weight:600;}
+.card a:hover {text-decoration:underline;}
+.card .summary {margin-top:10px; font-size:0.9em; color:#444;}
+.footer {background:#fff; text-align:center; padding:15px; font-size:0.8em; color:#1f2eb8; border-top:1px solid #eee;}
+.hidden {display:none;}
+"""
+
+_TAB_JS = """
 function showTab(cat) {
-  const tabs = document.querySelectorAll('.entries');
-  const buttons = document.querySelectorAll('.tabs button');
-  tabs.forEach(t => t.classList.add('hidden'));
-  buttons.forEach(b => b.classList.remove('active'));
-  document.getElementById('tab-' + cat).classList.remove('hidden');
-  document.getElementById('btn-' + cat).classList.add('active');
+  document.querySelectorAll('.card').forEach(c => c.classList.toggle('hidden', !c.classList.contains('cat-' + cat)));
+  document.querySelectorAll('.tabs button').forEach(b => b.classList.toggle('active', b.id === 'btn-' + cat));
 }
 // Show AI by default
 showTab('AI');
-</script>
-    """)
+"""
+
+
+def _minify_css(css: str) -> str:
+    """Drop the whitespace around CSS punctuation and the last ``;`` of each rule."""
+    css = re.sub(r"\s*([{};:,])\s*", r"\1", css.strip())
+    return css.replace(";}", "}")
 
-    parts.append("</body></html>")
-    output_path.write_text("\n".join(parts), encoding="utf-8")
+
+# Everything before and after the cards never changes, so it is built and
+# encoded once: head, minified CSS, header and tab buttons / footer and script.
+_HTML_HEAD = (
+    "<html><head><meta charset='UTF-8'><title>Briefed. Feed</title>"
+    "<link href='https://fonts.googleapis.com/css2?family=Poppins:wght@400;600&display=swap' rel='stylesheet'>"
+    f"<style>{_minify_css(_CSS)}</style></head><body>"
+    "<div class='header'><h1>Briefed.</h1><p>Your marketing news in one place</p></div>"
+    "<div class='tabs'>"
+    + "".join(f"<button onclick=\"showTab('{cat}')\" id='btn-{cat}'>{cat}</button>" for cat in CATEGORIES)
+    + "</div>"
+).encode("utf-8")
+
+_HTML_FOOT = (
+    "<div class='footer'>Updated automatically every day via GitHub Actions · "
+    "<span style='color:#1f2eb8;font-weight:600;'>Created by Rotem Bachar</span></div>"
+    f"<script>{_TAB_JS.strip()}</script></body></html>"
+).encode("utf-8")
+
+
+def generate_html(all_entries: list[Entry], output_path: Path) -> None:
+    """Generate HTML file with tabs for categories.
+
+    The page is written to a temporary file next to ``output_path`` and moved
+    into place with ``os.replace``, so readers never see a half-written page.
+    """
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    try:
+        with tmp_path.open("wb", buffering=1 << 16) as out:
+            write = out.write
+            write(_HTML_HEAD)
+
+            # Content: every card once, tagged with its categories; the tabs filter them
+            write(b"\n<div class='entries'>")
+            for entry in all_entries:
+                cat_classes = " ".join(f"cat-{c}" for c in categorize_entry(entry))
+                date_html = f"<div class='date'>{entry.date}</div>" if entry.date else ""
+                write((
+                    f"\n<div class='card {cat_classes}'><div class='source'>{html.escape(entry.source)}</div>"
+                    f"<a href='{html.escape(entry.link)}' target='_blank'>{html.escape(entry.title)}</a>"
+                    f"{date_html}<div class='summary'>{html.escape(entry.summary)}</div></div>"
+                ).encode("utf-8"))
+            write(b"\n</div>\n")
+
+            write(_HTML_FOOT)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def main() -> None:
-    all_entries = process_entries(FEEDS)
-    output_html = Path(__file__).resolve().parent / "index.html"
+    base_dir = Path(__file__).resolve().parent
+    cache_path = base_dir / CACHE_PATH
+    cache = load_cache(cache_path)
+    all_entries = process_entries(FEEDS, cache)
+    save_cache(cache, cache_path)
+    output_html = base_dir / "index.html"
     generate_html(all_entries, output_html)
     print(f"✅ Generated {output_html}")
 